@@ -1,13 +1,18 @@
-import json
 import logging
 import os
+import queue
+import re
 import sys
 import threading
 import time
-
-import darkdetect
-import pyperclip
-from pynput import keyboard as pykeyboard
+from contextlib import contextmanager
+from types import MappingProxyType
+
+try:
+    import orjson
+except ImportError:
+    import json
+    orjson = None
 from PySide6 import QtCore, QtGui, QtWidgets
 from PySide6.QtCore import Signal, Slot
 from PySide6.QtGui import QCursor, QGuiApplication
@@ -18,6 +23,105 @@ from ui.AboutWindow import AboutWindow
 from ui.CustomPopupWindow import CustomPopupWindow
 from ui.OnboardingWindow import OnboardingWindow
 from ui.SettingsWindow import SettingsWindow
+from ui.UIUtils import colorMode
+
+if sys.platform == 'win32':
+    from win32input import Win32Hotkey, send_ctrl_c, send_ctrl_v
+else:
+    from pynput import keyboard as pykeyboard
+
+# Prompt prefix and system instruction for each writing option
+_OPTION_PROMPTS = MappingProxyType({
+    "Relecture": (
+        "Relis et corrige ceci :\n\n",
+        "Tu es un relecteur précis. Corrige les erreurs, fond comme forme, grammaticales, orthographiques et typographiques également. Renvoie uniquement le texte corrigé, en préservant le style et la structure d'origine. En cas de texte incompréhensible, renvoie 'ERROR_TEXT_INCOMPATIBLE_WITH_REQUEST'. Pas de commentaires additionnels."
+    ),
+    "Réécriture": (
+        "Réécris ceci :\n\n",
+        "Tu es un assistant de rédaction. Améliore la formulation du texte fourni. Renvoie uniquement le texte réécrit, sans commentaires. En cas de texte incompréhensible, renvoie 'ERROR_TEXT_INCOMPATIBLE_WITH_REQUEST'."
+    ),
+    "Amical": (
+        "Rends ceci plus amical :\n\n",
+        "Tu es un assistant de rédaction. Réécris le texte pour le rendre plus chaleureux et accessible. Renvoie uniquement le texte modifié, sans commentaires. En cas de texte incompréhensible, renvoie 'ERROR_TEXT_INCOMPATIBLE_WITH_REQUEST'."
+    ),
+    "Professionnel": (
+        "Rends ceci plus professionnel :\n\n",
+        "Tu es un assistant de rédaction. Réécris le texte dans un style plus formel et professionnel. Renvoie uniquement le texte modifié, sans commentaires. En cas de texte incompréhensible, renvoie 'ERROR_TEXT_INCOMPATIBLE_WITH_REQUEST'."
+    ),
+    "Concis": (
+        "Rends ceci plus concis :\n\n",
+        "Tu es un assistant de rédaction. Réécris le texte de façon plus concise sans perdre l'information essentielle. Renvoie uniquement la version condensée, sans commentaires. En cas de texte incompréhensible, renvoie 'ERROR_TEXT_INCOMPATIBLE_WITH_REQUEST'."
+    ),
+    "Résumé": (
+        "Résume ceci :\n\n",
+        "Tu es un assistant de synthèse. Fournis un résumé clair et concis du texte. Renvoie uniquement le résumé, sans commentaires. En cas de texte incompréhensible, renvoie 'ERROR_TEXT_INCOMPATIBLE_WITH_REQUEST'."
+    ),
+    "Points-Clés": (
+        "Extrais les points clés de ceci :\n\n",
+        "Tu es un assistant d'analyse. Identifie et liste uniquement les points essentiels du texte, sans commentaires. En cas de texte incompréhensible, renvoie 'ERROR_TEXT_INCOMPATIBLE_WITH_REQUEST'."
+    ),
+    "Tableau": (
+        "Convertis ceci en tableau :\n\n",
+        "Tu es un assistant de conversion. Transforme le texte en tableau structuré. Renvoie uniquement le tableau formaté, sans commentaires. En cas de texte incompatible, renvoie 'ERROR_TEXT_INCOMPATIBLE_WITH_REQUEST'."
+    ),
+    "Personnalisé": (
+        "Applique le changement suivant à ce texte :\n\n",
+        "Tu es un assistant de rédaction polyvalent. Applique précisément la modification demandée au texte fourni. Renvoie uniquement le contenu modifié, sans commentaires. En cas de texte incompatible, renvoie 'ERROR_TEXT_INCOMPATIBLE_WITH_REQUEST'."
+    ),
+})
+
+# Sentinel returned by the model when the text cannot be processed
+_ERROR_MESSAGE = 'ERROR_TEXT_INCOMPATIBLE_WITH_REQUEST'
+_ERROR_CLEAN = ''.join(_ERROR_MESSAGE.split())
+_ERROR_LEN = len(_ERROR_MESSAGE)
+
+
+def _compile_prefix_pattern(message):
+    """
+    Compile a regex that fully matches any prefix of the message, ignoring whitespace
+    around and between its characters.
+    """
+    pattern = ''
+    for char in reversed(message):
+        pattern = rf'\s*{re.escape(char)}' + (f'(?:{pattern})?' if pattern else '')
+    return re.compile(rf'(?:{pattern})?\s*')
+
+
+_ERROR_PREFIX_RE = _compile_prefix_pattern(_ERROR_CLEAN)
+
+# Directory the app was launched from, and the app icon inside it
+_APP_DIR = os.path.dirname(sys.argv[0])
+_ICON_PATH = os.path.join(_APP_DIR, 'icons', 'app_icon.png')
+_ICON_EXISTS = os.path.exists(_ICON_PATH)
+
+
+class _ClipboardPasteRunnable(QtCore.QRunnable):
+    """
+    Simulates Ctrl+V on a pool thread and notifies the app once the paste has had time to complete.
+    """
+    def __init__(self, app):
+        super().__init__()
+        self.app = app
+
+    def run(self):
+        logging.debug('Simulating Ctrl+V')
+        try:
+            if sys.platform == 'win32':
+                send_ctrl_v()
+            else:
+                kbrd = pykeyboard.Controller()
+                kbrd.press(pykeyboard.Key.ctrl.value)
+                kbrd.press('v')
+                kbrd.release('v')
+                kbrd.release(pykeyboard.Key.ctrl.value)
+
+            # Wait for the paste operation to complete
+            time.sleep(0.2)
+        except Exception as e:
+            logging.error(f'Error simulating Ctrl+V: {e}')
+        finally:
+            # Queued back onto the GUI thread
+            self.app.paste_finished_signal.emit()
 
 
 class WritingToolApp(QtWidgets.QApplication):
@@ -25,30 +129,67 @@ class WritingToolApp(QtWidgets.QApplication):
     The main application class for Writing Tools.
     """
     output_ready_signal = Signal(str)
+    output_finished_signal = Signal()
     show_message_signal = Signal(str, str)  # New signal for showing message boxes
     hotkey_triggered_signal = Signal()
+    paste_finished_signal = Signal()
 
     def __init__(self, argv):
         super().__init__(argv)
         logging.debug('Initializing WritingToolApp')
+        # Talk to the clipboard in-process rather than through xclip/xsel subprocesses
+        self._clipboard = QGuiApplication.clipboard()
+        # Set the window icon once for every window of the app
+        self.app_icon = QtGui.QIcon(_ICON_PATH) if _ICON_EXISTS else None
+        if self.app_icon is not None:
+            self.setWindowIcon(self.app_icon)
+        self.primary_screen = self.primaryScreen()
+        self.primaryScreenChanged.connect(self.on_primary_screen_changed)
         self.output_ready_signal.connect(self.replace_text)
+        self.output_finished_signal.connect(self.on_output_finished)
         self.show_message_signal.connect(self.show_message_box)
-        self.hotkey_triggered_signal.connect(self.on_hotkey_pressed)
+        # Emitted from the pynput listener thread; this single queued hop puts us on the GUI thread
+        self.hotkey_triggered_signal.connect(self.on_hotkey_pressed, QtCore.Qt.ConnectionType.QueuedConnection)
+        self.paste_finished_signal.connect(self.on_paste_finished)
         self.config = None
         self.config_path = None
         self.load_config()
         self.onboarding_window = None
         self.popup_window = None
         self.tray_icon = None
+        self.tray_menu = None
+        self.tray_menu_styled = False
         self.settings_window = None
         self.about_window = None
         self.registered_hotkey = None
-        self.output_queue = ""
+        self.reset_output()
         self.last_replace = 0
+        self.paste_in_progress = False
+        self.paste_finish_pending = False
+        self.clipboard_backup = None
+
+        # Streamed chunks are coalesced until the stream pauses or finishes
+        self.flush_timer = QtCore.QTimer(self)
+        self.flush_timer.setSingleShot(True)
+        self.flush_timer.setInterval(50)
+        self.flush_timer.timeout.connect(self.flush_output)
         self.hotkey_listener = None
+        self.native_hotkey = None
+        self.handling_hotkey = False
 
-        # Setup available AI providers
-        self.providers = [Gemini15FlashProvider(self), OpenAICompatibleProvider(self)]
+        self.current_provider = None
+
+        # AI requests run one at a time on a single long-lived daemon worker thread,
+        # so exiting never waits for a request that is still in flight
+        self.request_queue = queue.Queue()
+        threading.Thread(target=self.process_requests, name='wt-ai', daemon=True).start()
+
+        # Setup available AI providers; each one is only instantiated when first needed
+        self._provider_factories = {
+            'Gemini 1.5 Flash (Recommended)': Gemini15FlashProvider,
+            'OpenAI Compatible (For Experts)': OpenAICompatibleProvider,
+        }
+        self._providers_by_name = {}
 
         if not self.config:
             logging.debug('No config found, showing onboarding')
@@ -59,36 +200,62 @@ class WritingToolApp(QtWidgets.QApplication):
             # Initialize the current provider, defaulting to Gemini 1.5 Flash
             provider_name = self.config.get('provider', 'Gemini 1.5 Flash')
 
-            self.current_provider = next((provider for provider in self.providers if provider.provider_name == provider_name), None)
-            if not self.current_provider:
+            if provider_name not in self._provider_factories:
                 logging.warning(f'Provider {provider_name} not found. Using default provider.')
-                self.current_provider = self.providers[0]
+            self.current_provider = self.get_provider(provider_name)
 
             self.current_provider.load_config(self.config.get("providers", {}).get(provider_name, {}))
 
             self.create_tray_icon()
             self.register_hotkey()
 
+    @property
+    def provider_names(self):
+        """
+        The names of all available AI providers, in display order.
+        """
+        return list(self._provider_factories)
+
+    def get_provider(self, provider_name):
+        """
+        Get the provider with the given name, creating it on first use.
+        Unknown names fall back to the default (first) provider.
+        """
+        if provider_name not in self._provider_factories:
+            provider_name = next(iter(self._provider_factories))
+        provider = self._providers_by_name.get(provider_name)
+        if provider is None:
+            provider = self._provider_factories[provider_name](self)
+            self._providers_by_name[provider_name] = provider
+        return provider
+
     def load_config(self):
         """
         Load the configuration file.
         """
-        self.config_path = os.path.join(os.path.dirname(sys.argv[0]), 'config.json')
+        self.config_path = os.path.join(_APP_DIR, 'config.json')
         logging.debug(f'Loading config from {self.config_path}')
-        if os.path.exists(self.config_path):
-            with open(self.config_path, 'r') as f:
-                self.config = json.load(f)
-                logging.debug('Config loaded successfully')
-        else:
+        try:
+            with open(self.config_path, 'rb') as f:
+                data = f.read()
+        except FileNotFoundError:
             logging.debug('Config file not found')
             self.config = None
+            return
+
+        self.config = orjson.loads(data) if orjson else json.loads(data)
+        logging.debug('Config loaded successfully')
 
     def save_config(self, config):
         """
         Save the configuration file.
         """
-        with open(self.config_path, 'w') as f:
-            json.dump(config, f, indent=4)
+        if orjson:
+            data = orjson.dumps(config, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+        else:
+            data = (json.dumps(config, indent=2, ensure_ascii=False) + '\n').encode('utf-8')
+        with open(self.config_path, 'wb') as f:
+            f.write(data)
             logging.debug('Config saved successfully')
         self.config = config
 
@@ -139,31 +306,81 @@ class WritingToolApp(QtWidgets.QApplication):
         except Exception as e:
             logging.error(f'Failed to register hotkey: {e}')
 
+    def start_native_hotkey(self):
+        """
+        Register the hotkey with the OS on Windows, so it is delivered through the Qt event loop.
+        """
+        shortcut = self.config.get('shortcut', 'ctrl+space')
+        logging.debug(f'Registering native global hotkey for shortcut: {shortcut}')
+        try:
+            if self.native_hotkey is None:
+                # WM_HOTKEY is delivered on the GUI thread, so no cross-thread signal is needed;
+                # the filter defers the callback to the event loop and returns immediately
+                self.native_hotkey = Win32Hotkey(self.on_hotkey_pressed)
+                self.installNativeEventFilter(self.native_hotkey)
+            self.native_hotkey.register(shortcut)
+            self.registered_hotkey = shortcut
+        except Exception as e:
+            logging.error(f'Failed to register hotkey: {e}')
+
     def register_hotkey(self):
         """
         Register the global hotkey for activating Writing Tools.
         """
         logging.debug('Registering hotkey')
-        self.start_hotkey_listener()
+        if sys.platform == 'win32':
+            self.start_native_hotkey()
+        else:
+            self.start_hotkey_listener()
         logging.debug('Hotkey registered')
 
+    @Slot()
     def on_hotkey_pressed(self):
         """
-        Handle the hotkey press event.
+        Handle the hotkey press event. Always runs on the GUI thread.
         """
         logging.debug('Hotkey pressed')
 
+        # Copying the selection spins a local event loop, in which another hotkey press may arrive
+        if self.handling_hotkey:
+            logging.debug('Already handling a hotkey press, ignoring')
+            return
+
+        self.cancel_pending_requests()
+
         if self.current_provider:
             logging.debug("Cancelling current provider's request")
             self.current_provider.cancel()
-            self.output_queue = ""
+            self.reset_output()
 
-        QtCore.QMetaObject.invokeMethod(self, "_show_popup", QtCore.Qt.ConnectionType.QueuedConnection)
+        # Snapshot where the user was when they pressed the hotkey, before copying the selection
+        cursor_pos = QCursor.pos()
+        screen = QGuiApplication.screenAt(cursor_pos)
+        if screen is None:
+            screen = self.primary_screen
 
-    @Slot()
-    def _show_popup(self):
+        self.handling_hotkey = True
+        try:
+            self._show_popup(cursor_pos, screen)
+        finally:
+            self.handling_hotkey = False
+            # Finish the paste and paste the output that were held back while copying the selection
+            if self.paste_finish_pending:
+                self.paste_finish_pending = False
+                self.on_paste_finished()
+            elif self._output_len:
+                self.flush_output()
+
+    @Slot(QtGui.QScreen)
+    def on_primary_screen_changed(self, screen):
         """
-        Show the popup window when the hotkey is pressed.
+        Keep track of the primary screen, used when the cursor is on no screen.
+        """
+        self.primary_screen = screen
+
+    def _show_popup(self, cursor_pos, screen):
+        """
+        Show the popup window at the given cursor position on the given screen.
         """
         logging.debug('Showing popup window')
         selected_text = self.get_selected_text()
@@ -171,22 +388,15 @@ class WritingToolApp(QtWidgets.QApplication):
         logging.debug(f'Selected text: "{selected_text}"')
         try:
             if self.popup_window is not None:
-                logging.debug('Existing popup window found')
+                logging.debug('Existing popup window found, reusing it')
                 if self.popup_window.isVisible():
                     logging.debug('Closing existing visible popup window')
                     self.popup_window.close()
-                self.popup_window = None
-            logging.debug('Creating new popup window')
-            self.popup_window = CustomPopupWindow(self, selected_text)
-
-            # Set the window icon
-            icon_path = os.path.join(os.path.dirname(sys.argv[0]), 'icons', 'app_icon.png')
-            if os.path.exists(icon_path): self.setWindowIcon(QtGui.QIcon(icon_path))
-            # Get the screen containing the cursor
-            cursor_pos = QCursor.pos()
-            screen = QGuiApplication.screenAt(cursor_pos)
-            if screen is None:
-                screen = QGuiApplication.primaryScreen()
+                self.popup_window.reset(selected_text)
+            else:
+                logging.debug('Creating new popup window')
+                self.popup_window = CustomPopupWindow(self, selected_text)
+
             screen_geometry = screen.geometry()
             logging.debug(f'Cursor is on screen: {screen.name()}')
             logging.debug(f'Screen geometry: {screen_geometry}')
@@ -217,45 +427,94 @@ class WritingToolApp(QtWidgets.QApplication):
         """
         Get the currently selected text from any application.
         """
-        # Backup the clipboard
-        clipboard_backup = pyperclip.paste()
-        logging.debug(f'Clipboard backup: "{clipboard_backup}"')
+        # The clipboard is backed up and restored around the copy
+        with self.clipboard_scope():
+            # Clear the clipboard
+            self.clear_clipboard()
 
-        # Clear the clipboard
-        self.clear_clipboard()
+            # Simulate Ctrl+C
+            logging.debug('Simulating Ctrl+C')
 
-        # Simulate Ctrl+C
-        logging.debug('Simulating Ctrl+C')
+            if sys.platform == 'win32':
+                press_ctrl_c = send_ctrl_c
+            else:
+                kbrd = pykeyboard.Controller()
 
-        kbrd = pykeyboard.Controller()
+                def press_ctrl_c():
+                    kbrd.press(pykeyboard.Key.ctrl.value)
+                    kbrd.press('c')
+                    kbrd.release('c')
+                    kbrd.release(pykeyboard.Key.ctrl.value)
 
-        def press_ctrl_c():
-            kbrd.press(pykeyboard.Key.ctrl.value)
-            kbrd.press('c')
-            kbrd.release('c')
-            kbrd.release(pykeyboard.Key.ctrl.value)
+            # Wait for the clipboard to update, or give up after the timeout
+            self.wait_for_clipboard_change(press_ctrl_c)
 
-        press_ctrl_c()
+            # Get the selected text
+            selected_text = self._clipboard.text()
+            logging.debug(f'Selected text: "{selected_text}"')
 
-        # Wait for the clipboard to update
-        time.sleep(0.2)
+        return selected_text
 
-        # Get the selected text
-        selected_text = pyperclip.paste()
-        logging.debug(f'Selected text: "{selected_text}"')
+    def snapshot_clipboard(self):
+        """
+        Copy the clipboard contents in all of their formats (text, HTML, images...).
+        """
+        snapshot = QtCore.QMimeData()
+        mime_data = self._clipboard.mimeData()
+        if mime_data is not None:
+            for mime_format in mime_data.formats():
+                snapshot.setData(mime_format, mime_data.data(mime_format))
+        logging.debug(f'Clipboard backup formats: {snapshot.formats()}')
+        return snapshot
 
-        # Restore the clipboard
-        pyperclip.copy(clipboard_backup)
+    @contextmanager
+    def clipboard_scope(self):
+        """
+        Back up the clipboard on entry and restore it on exit.
+        """
+        snapshot = self.snapshot_clipboard()
+        try:
+            yield
+        finally:
+            # The clipboard takes ownership of the snapshot
+            self._clipboard.setMimeData(snapshot)
 
-        return selected_text
+    def wait_for_clipboard_change(self, action, timeout_ms=300):
+        """
+        Run the given action and wait until the clipboard holds new content or the timeout expires.
+        """
+        loop = QtCore.QEventLoop()
+        changed = []
 
-    @staticmethod
-    def clear_clipboard():
+        def on_data_changed():
+            # A late notification for clearing the clipboard (WM_CLIPBOARDUPDATE on Windows
+            # arrives through the event loop) must not end the wait before the copy lands
+            mime_data = self._clipboard.mimeData()
+            if mime_data is None or not mime_data.formats():
+                return
+            changed.append(True)
+            loop.quit()
+
+        timer = QtCore.QTimer(loop)
+        timer.setSingleShot(True)
+        timer.timeout.connect(loop.quit)
+
+        self._clipboard.dataChanged.connect(on_data_changed)
+        try:
+            timer.start(timeout_ms)
+            action()
+            # The signal may already have fired synchronously during the action
+            if not changed:
+                loop.exec()
+        finally:
+            self._clipboard.dataChanged.disconnect(on_data_changed)
+
+    def clear_clipboard(self):
         """
         Clear the system clipboard.
         """
         try:
-            pyperclip.copy('')
+            self._clipboard.clear()
         except Exception as e:
             logging.error(f'Error clearing clipboard: {e}')
 
@@ -264,7 +523,27 @@ class WritingToolApp(QtWidgets.QApplication):
         Process the selected writing option in a separate thread.
         """
         logging.debug(f'Processing option: {option}')
-        threading.Thread(target=self.process_option_thread, args=(option, selected_text, custom_change), daemon=True).start()
+        self.request_queue.put((option, selected_text, custom_change))
+
+    def process_requests(self):
+        """
+        Worker loop that processes the queued writing options one at a time.
+        """
+        while True:
+            request = self.request_queue.get()
+            if request is None:
+                return
+            self.process_option_thread(*request)
+
+    def cancel_pending_requests(self):
+        """
+        Drop the queued requests that haven't started yet.
+        """
+        while True:
+            try:
+                self.request_queue.get_nowait()
+            except queue.Empty:
+                break
 
     def process_option_thread(self, option, selected_text, custom_change=None):
         """
@@ -272,45 +551,6 @@ class WritingToolApp(QtWidgets.QApplication):
         """
         logging.debug(f'Starting processing thread for option: {option}')
         try:
-            option_prompts = {
-                "Relecture": [
-                    "Relis et corrige ceci :\n\n",
-                    "Tu es un relecteur précis. Corrige les erreurs, fond comme forme, grammaticales, orthographiques et typographiques également. Renvoie uniquement le texte corrigé, en préservant le style et la structure d'origine. En cas de texte incompréhensible, renvoie 'ERROR_TEXT_INCOMPATIBLE_WITH_REQUEST'. Pas de commentaires additionnels."
-                ],
-                "Réécriture": [
-                    "Réécris ceci :\n\n",
-                    "Tu es un assistant de rédaction. Améliore la formulation du texte fourni. Renvoie uniquement le texte réécrit, sans commentaires. En cas de texte incompréhensible, renvoie 'ERROR_TEXT_INCOMPATIBLE_WITH_REQUEST'."
-                ],
-                "Amical": [
-                    "Rends ceci plus amical :\n\n",
-                    "Tu es un assistant de rédaction. Réécris le texte pour le rendre plus chaleureux et accessible. Renvoie uniquement le texte modifié, sans commentaires. En cas de texte incompréhensible, renvoie 'ERROR_TEXT_INCOMPATIBLE_WITH_REQUEST'."
-                ],
-                "Professionnel": [
-                    "Rends ceci plus professionnel :\n\n",
-                    "Tu es un assistant de rédaction. Réécris le texte dans un style plus formel et professionnel. Renvoie uniquement le texte modifié, sans commentaires. En cas de texte incompréhensible, renvoie 'ERROR_TEXT_INCOMPATIBLE_WITH_REQUEST'."
-                ],
-                "Concis": [
-                    "Rends ceci plus concis :\n\n",
-                    "Tu es un assistant de rédaction. Réécris le texte de façon plus concise sans perdre l'information essentielle. Renvoie uniquement la version condensée, sans commentaires. En cas de texte incompréhensible, renvoie 'ERROR_TEXT_INCOMPATIBLE_WITH_REQUEST'."
-                ],
-                "Résumé": [
-                    "Résume ceci :\n\n",
-                    "Tu es un assistant de synthèse. Fournis un résumé clair et concis du texte. Renvoie uniquement le résumé, sans commentaires. En cas de texte incompréhensible, renvoie 'ERROR_TEXT_INCOMPATIBLE_WITH_REQUEST'."
-                ],
-                "Points-Clés": [
-                    "Extrais les points clés de ceci :\n\n",
-                    "Tu es un assistant d'analyse. Identifie et liste uniquement les points essentiels du texte, sans commentaires. En cas de texte incompréhensible, renvoie 'ERROR_TEXT_INCOMPATIBLE_WITH_REQUEST'."
-                ],
-                "Tableau": [
-                    "Convertis ceci en tableau :\n\n",
-                    "Tu es un assistant de conversion. Transforme le texte en tableau structuré. Renvoie uniquement le tableau formaté, sans commentaires. En cas de texte incompatible, renvoie 'ERROR_TEXT_INCOMPATIBLE_WITH_REQUEST'."
-                ],
-                "Personnalisé": [
-                    "Applique le changement suivant à ce texte :\n\n",
-                    "Tu es un assistant de rédaction polyvalent. Applique précisément la modification demandée au texte fourni. Renvoie uniquement le contenu modifié, sans commentaires. En cas de texte incompatible, renvoie 'ERROR_TEXT_INCOMPATIBLE_WITH_REQUEST'."
-                ]
-            }
-
             if selected_text.strip() == '':
                 # No selected text
                 if option == 'Custom':
@@ -320,13 +560,13 @@ class WritingToolApp(QtWidgets.QApplication):
                     self.show_message_signal.emit('Error', 'Please select text to use this option.')
                     return
             else:
-                prompt_prefix, system_instruction = option_prompts.get(option, ('', ''))
+                prompt_prefix, system_instruction = _OPTION_PROMPTS.get(option, ('', ''))
                 if option == 'Custom':
                     prompt = f"{prompt_prefix}Described change: {custom_change}\n\nText: {selected_text}"
                 else:
                     prompt = f"{prompt_prefix}{selected_text}"
 
-            self.output_queue = ""
+            self.reset_output()
 
             self.current_provider.get_response(system_instruction, prompt)
 
@@ -345,60 +585,114 @@ class WritingToolApp(QtWidgets.QApplication):
         """
         Replace the selected text with the new text generated by the AI.
         """
-        error_message = 'ERROR_TEXT_INCOMPATIBLE_WITH_REQUEST'
-
         # Confirm new_text exists and is a string
         if new_text and isinstance(new_text, str):
-            self.output_queue += new_text
-            current_output = self.output_queue.strip()  # Strip whitespace for comparison
+            self._output_parts.append(new_text)
+            self._output_len += len(new_text)
+            # (Re)start the debounce window
+            self.flush_timer.start()
+        else:
+            logging.debug('No new text to replace')
 
-            # If the new text is the error message, show a message box
-            if current_output == error_message:
-                self.show_message_signal.emit('Error', 'The text is incompatible with the requested change.')
-                return
+    @Slot()
+    def flush_output(self):
+        """
+        Paste all output received so far, e.g. when the stream pauses or finishes.
+        """
+        self.flush_timer.stop()
+        # Held back until the selection has been copied; on_hotkey_pressed flushes afterwards
+        if self.handling_hotkey:
+            return
+        if self._output_len:
+            self.paste_pending_output()
 
-            # Check if we're building up to the error message (to prevent partial pasting)
-            # Only do this check if the current output length is less than error message
-            if len(current_output) <= len(error_message):
-                # Remove all whitespace for comparison to handle any format
-                clean_current = ''.join(current_output.split())
-                clean_error = ''.join(error_message.split())
-                if clean_current == clean_error[:len(clean_current)]:
-                    return
+    @Slot()
+    def on_output_finished(self):
+        """
+        Paste whatever is left once the provider has finished its response.
+        """
+        self.output_finished = True
+        self.flush_output()
 
-            logging.debug('Replacing text')
-            try:
-                # Backup the clipboard
-                clipboard_backup = pyperclip.paste()
+    def paste_pending_output(self):
+        """
+        Paste the queued output over the selection, unless a paste is already in progress.
+        """
+        # Setting the clipboard now would be read back as the selection being copied
+        if self.handling_hotkey:
+            return
 
-                # Clean the output text and set the clipboard
-                cleaned_text = self.output_queue.rstrip('\n')  # Remove trailing newlines
-                pyperclip.copy(cleaned_text)
+        # Once the output stops looking like the error message, appending to it can't change that
+        if self._output_maybe_error:
+            current_output = ''.join(self._output_parts)
 
-                # Simulate Ctrl+V
-                logging.debug('Simulating Ctrl+V')
+            # Check if we're building up to the error message (to prevent partial pasting)
+            if _ERROR_PREFIX_RE.fullmatch(current_output):
+                # If the new text is the error message, show a message box
+                if self._output_len >= _ERROR_LEN and current_output.strip() == _ERROR_MESSAGE:
+                    self.show_message_signal.emit('Error', 'The text is incompatible with the requested change.')
+                    self.reset_output()
+                    return
+                # Once the response is complete, a partial match is just text
+                if not self.output_finished:
+                    return
+            self._output_maybe_error = False
 
-                kbrd = pykeyboard.Controller()
+        # The queued text will be pasted once the current paste has finished
+        if self.paste_in_progress:
+            return
 
-                def press_ctrl_v():
-                    kbrd.press(pykeyboard.Key.ctrl.value)
-                    kbrd.press('v')
-                    kbrd.release('v')
-                    kbrd.release(pykeyboard.Key.ctrl.value)
+        logging.debug('Replacing text')
+        try:
+            # Backup the clipboard
+            self.clipboard_backup = self.snapshot_clipboard()
+
+            # Clean the output text and set the clipboard
+            cleaned_text = ''.join(self._output_parts).rstrip('\n')  # Remove trailing newlines
+            self._clipboard.setText(cleaned_text)
+            # The error message can only start a response, so later output isn't checked again
+            self._output_parts = []
+            self._output_len = 0
+
+            # Simulate Ctrl+V off the GUI thread
+            self.paste_in_progress = True
+            QtCore.QThreadPool.globalInstance().start(_ClipboardPasteRunnable(self))
+        except Exception as e:
+            self.paste_in_progress = False
+            logging.error(f'Error replacing text: {e}')
 
-                press_ctrl_v()
+    @Slot()
+    def on_paste_finished(self):
+        """
+        Restore the clipboard after a paste, then paste any output that arrived meanwhile.
+        """
+        # The clipboard belongs to get_selected_text's clipboard_scope until the copy is done;
+        # restoring into it now would end the copy early and be overwritten on scope exit
+        if self.handling_hotkey:
+            self.paste_finish_pending = True
+            return
 
-                # Wait for the paste operation to complete
-                time.sleep(0.2)
+        try:
+            # The clipboard takes ownership of the snapshot
+            self._clipboard.setMimeData(self.clipboard_backup)
+        except Exception as e:
+            logging.error(f'Error restoring clipboard: {e}')
+        self.clipboard_backup = None
+        self.paste_in_progress = False
 
-                # Restore the clipboard
-                pyperclip.copy(clipboard_backup)
+        if self._output_len:
+            self.paste_pending_output()
 
-                self.output_queue = ""
-            except Exception as e:
-                logging.error(f'Error replacing text: {e}')
-        else:
-            logging.debug('No new text to replace')
+    def reset_output(self):
+        """
+        Discard any AI output that has not been pasted yet, and expect a new response.
+        """
+        self._output_parts = []
+        self._output_len = 0
+        # Whether the output so far could still be building up to the error message
+        self._output_maybe_error = True
+        # Whether the provider has finished sending the current response
+        self.output_finished = False
 
     def create_tray_icon(self):
         """
@@ -409,39 +703,58 @@ class WritingToolApp(QtWidgets.QApplication):
             return
 
         logging.debug('Creating system tray icon')
-        icon_path = os.path.join(os.path.dirname(sys.argv[0]), 'icons', 'app_icon.png')
-        if not os.path.exists(icon_path):
-            logging.warning(f'Tray icon not found at {icon_path}')
+        if self.app_icon is None:
+            logging.warning(f'Tray icon not found at {_ICON_PATH}')
             # Use a default icon if not found
             self.tray_icon = QtWidgets.QSystemTrayIcon(self)
         else:
-            self.tray_icon = QtWidgets.QSystemTrayIcon(QtGui.QIcon(icon_path), self)
+            self.tray_icon = QtWidgets.QSystemTrayIcon(self.app_icon, self)
         # Set the tooltip (hover name) for the tray icon
         self.tray_icon.setToolTip("WritingTools")
-        tray_menu = QtWidgets.QMenu()
 
-        # Apply dark mode styles using darkdetect
-        self.apply_dark_mode_styles(tray_menu)
+        self.tray_menu = QtWidgets.QMenu()
 
-        settings_action = tray_menu.addAction('Settings')
+        settings_action = self.tray_menu.addAction('Settings')
         settings_action.triggered.connect(self.show_settings)
 
-        about_action = tray_menu.addAction('About')
+        about_action = self.tray_menu.addAction('About')
         about_action.triggered.connect(self.show_about)
 
-        exit_action = tray_menu.addAction('Exit')
+        exit_action = self.tray_menu.addAction('Exit')
         exit_action.triggered.connect(self.exit_app)
 
-        self.tray_icon.setContextMenu(tray_menu)
+        # The menu is only styled the first time it is opened, and again after a theme change
+        self.tray_menu.aboutToShow.connect(self.on_tray_menu_about_to_show)
+        self.paletteChanged.connect(self.on_palette_changed)
+        if hasattr(self.styleHints(), 'colorSchemeChanged'):
+            self.styleHints().colorSchemeChanged.connect(self.on_palette_changed)
+
+        self.tray_icon.setContextMenu(self.tray_menu)
         self.tray_icon.show()
         logging.debug('Tray icon displayed')
 
+    @Slot()
+    def on_tray_menu_about_to_show(self):
+        """
+        (Re)apply the tray menu styles if needed.
+        """
+        if not self.tray_menu_styled:
+            self.apply_dark_mode_styles(self.tray_menu)
+            self.tray_menu_styled = True
+
+    @Slot()
+    def on_palette_changed(self):
+        """
+        Restyle the tray menu the next time it is opened.
+        """
+        self.tray_menu_styled = False
+
     @staticmethod
     def apply_dark_mode_styles(menu):
         """
-        Apply styles to the tray menu based on system theme using darkdetect.
+        Apply styles to the tray menu based on the system theme.
         """
-        is_dark_mode = darkdetect.isDark()
+        is_dark_mode = colorMode() == 'dark'
         palette = menu.palette()
 
         if is_dark_mode:
@@ -483,5 +796,11 @@ class WritingToolApp(QtWidgets.QApplication):
         logging.debug('Stopping the listener')
         if self.hotkey_listener is not None:
             self.hotkey_listener.stop()
+        if self.native_hotkey is not None:
+            self.native_hotkey.unregister()
+        if self.current_provider:
+            self.current_provider.cancel()
+        self.cancel_pending_requests()
+        self.request_queue.put(None)
         logging.debug('Exiting application')
         self.quit()
@@ -3,9 +3,6 @@ import webbrowser
 from abc import ABC, abstractmethod
 from typing import List
 
-import google.generativeai as genai
-from google.generativeai.types import HarmBlockThreshold, HarmCategory
-from openai import OpenAI
 from PySide6 import QtWidgets
 from PySide6.QtWidgets import QVBoxLayout
 
@@ -41,16 +38,16 @@ class TextSetting(AIProviderSetting):
     def render_to_layout(self, layout: QVBoxLayout):
         row_layout = QtWidgets.QHBoxLayout()
         label = QtWidgets.QLabel(self.display_name)
-        label.setStyleSheet(f"font-size: 16px; color: {'#ffffff' if colorMode == 'dark' else '#333333'};")
+        label.setStyleSheet(f"font-size: 16px; color: {'#ffffff' if colorMode() == 'dark' else '#333333'};")
         row_layout.addWidget(label)
 
         self.input = QtWidgets.QLineEdit(self.internal_value)
         self.input.setStyleSheet(f"""
             font-size: 16px;
             padding: 5px;
-            background-color: {'#444' if colorMode == 'dark' else 'white'};
-            color: {'#ffffff' if colorMode == 'dark' else '#000000'};
-            border: 1px solid {'#666' if colorMode == 'dark' else '#ccc'};
+            background-color: {'#444' if colorMode() == 'dark' else 'white'};
+            color: {'#ffffff' if colorMode() == 'dark' else '#000000'};
+            border: 1px solid {'#666' if colorMode() == 'dark' else '#ccc'};
         """)
 
         self.input.setPlaceholderText(self.description)
@@ -172,10 +169,14 @@ class Gemini15FlashProvider(AIProvider):
             self.app.output_ready_signal.emit("An error occurred while streaming.")
         finally:
             self.close_requested = False
-            self.app.replace_text(True)
+            self.app.output_finished_signal.emit()
 
 
     def after_load(self):
+        # Imported here so only the SDK of the provider in use is ever loaded
+        import google.generativeai as genai
+        from google.generativeai.types import HarmBlockThreshold, HarmCategory
+
         genai.configure(api_key=self.api_key)
 
         self.model = genai.GenerativeModel(
@@ -249,14 +250,17 @@ class OpenAICompatibleProvider(AIProvider):
             finally:
                 response.close()
                 self.close_requested = False
-                self.app.replace_text(True)
+                self.app.output_finished_signal.emit()
 
         else:
             # Strip any trailing newlines from the complete response
             self.app.output_ready_signal.emit(response.choices[0].message.content.strip())
-            self.app.replace_text(True)
+            self.app.output_finished_signal.emit()
 
     def after_load(self):
+        # Imported here so only the SDK of the provider in use is ever loaded
+        from openai import OpenAI
+
         self.client = OpenAI(api_key=self.api_key, base_url=self.api_base, organization=self.api_organisation, project=self.api_project)
 
     def before_load(self):
@@ -26,7 +26,7 @@ class AboutWindow(QtWidgets.QWidget):
         content_layout.setSpacing(20)
 
         title_label = QtWidgets.QLabel("About Writing Tools")
-        title_label.setStyleSheet(f"font-size: 24px; font-weight: bold; color: {'#ffffff' if colorMode == 'dark' else '#333333'};")
+        title_label.setStyleSheet(f"font-size: 24px; font-weight: bold; color: {'#ffffff' if colorMode() == 'dark' else '#333333'};")
         content_layout.addWidget(title_label, alignment=QtCore.Qt.AlignmentFlag.AlignCenter)
 
         about_text = """
@@ -53,7 +53,7 @@ class AboutWindow(QtWidgets.QWidget):
                 """
 
         about_label = QtWidgets.QLabel(about_text)
-        about_label.setStyleSheet(f"font-size: 16px; color: {'#ffffff' if colorMode == 'dark' else '#333333'};")
+        about_label.setStyleSheet(f"font-size: 16px; color: {'#ffffff' if colorMode() == 'dark' else '#333333'};")
         about_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
         about_label.setWordWrap(True)
         about_label.setOpenExternalLinks(True)  # Allow opening hyperlinks
@@ -47,15 +47,15 @@ class CustomPopupWindow(QtWidgets.QWidget):
         close_button.setStyleSheet(f"""
             QPushButton {{
                 background-color: transparent;
-                color: {'#ffffff' if colorMode == 'dark' else '#333333'};
+                color: {'#ffffff' if colorMode() == 'dark' else '#333333'};
                 font-size: 20px;
                 border: none;
                 border-radius: 12px;
                 padding: 0px;
             }}
             QPushButton:hover {{
-                background-color: {'#333333' if colorMode == 'dark' else '#ebebeb'};
-                color: {'#ffffff' if colorMode == 'dark' else '#333333'};
+                background-color: {'#333333' if colorMode() == 'dark' else '#ebebeb'};
+                color: {'#ffffff' if colorMode() == 'dark' else '#333333'};
             }}
         """)
         close_button.clicked.connect(self.close)
@@ -64,17 +64,14 @@ class CustomPopupWindow(QtWidgets.QWidget):
         # Custom change input and send button layout
         input_layout = QtWidgets.QHBoxLayout()
 
-        has_text = not not self.selected_text.strip()
-
         self.custom_input = QtWidgets.QLineEdit()
-        self.custom_input.setPlaceholderText("Describe your change..." if has_text else "Please enter an instruction...")
         self.custom_input.setStyleSheet(f"""
             QLineEdit {{
                 padding: 8px;
-                border: 1px solid {'#777' if colorMode == 'dark' else '#ccc'};
+                border: 1px solid {'#777' if colorMode() == 'dark' else '#ccc'};
                 border-radius: 8px;
-                background-color: {'#333' if colorMode == 'dark' else 'white'};
-                color: {'#ffffff' if colorMode == 'dark' else '#000000'};
+                background-color: {'#333' if colorMode() == 'dark' else 'white'};
+                color: {'#ffffff' if colorMode() == 'dark' else '#000000'};
             }}
         """)
         self.custom_input.returnPressed.connect(self.on_custom_change)
@@ -82,16 +79,16 @@ class CustomPopupWindow(QtWidgets.QWidget):
         input_layout.addWidget(self.custom_input)
 
         send_button = QtWidgets.QPushButton()
-        send_button.setIcon(QtGui.QIcon(os.path.join(os.path.dirname(sys.argv[0]), 'icons', 'send' + ('_dark' if colorMode == 'dark' else '_light') + '.png')))
+        send_button.setIcon(QtGui.QIcon(os.path.join(os.path.dirname(sys.argv[0]), 'icons', 'send' + ('_dark' if colorMode() == 'dark' else '_light') + '.png')))
         send_button.setStyleSheet(f"""
             QPushButton {{
-                background-color: {'#2e7d32' if colorMode == 'dark' else '#4CAF50'};
+                background-color: {'#2e7d32' if colorMode() == 'dark' else '#4CAF50'};
                 border: none;
                 border-radius: 8px;
                 padding: 5px;
             }}
             QPushButton:hover {{
-                background-color: {'#1b5e20' if colorMode == 'dark' else '#45a049'};
+                background-color: {'#1b5e20' if colorMode() == 'dark' else '#45a049'};
             }}
         """)
         send_button.setFixedSize(self.custom_input.sizeHint().height(), self.custom_input.sizeHint().height())
@@ -100,50 +97,50 @@ class CustomPopupWindow(QtWidgets.QWidget):
 
         content_layout.addLayout(input_layout)
 
-        if has_text:
-
-            # Options grid
-            options_grid = QtWidgets.QGridLayout()
-            options_grid.setSpacing(10)
-
-            options = [
-                ('Relecture', 'icons/magnifying-glass' + ('_dark' if colorMode == 'dark' else '_light') + '.png', self.on_proofread),
-                ('Réécriture', 'icons/rotate-left' + ('_dark' if colorMode == 'dark' else '_light') + '.png', self.on_rewrite),
-                ('Amical', 'icons/smiley-face' + ('_dark' if colorMode == 'dark' else '_light') + '.png', self.on_friendly),
-                ('Professionnel', 'icons/briefcase' + ('_dark' if colorMode == 'dark' else '_light') + '.png', self.on_professional),
-                ('Concis', 'icons/concise' + ('_dark' if colorMode == 'dark' else '_light') + '.png', self.on_concise),
-                ('Résumé', 'icons/summary' + ('_dark' if colorMode == 'dark' else '_light') + '.png', self.on_summary),
-                ('Points-Clés', 'icons/keypoints' + ('_dark' if colorMode == 'dark' else '_light') + '.png', self.on_keypoints),
-                ('Tableau', 'icons/table' + ('_dark' if colorMode == 'dark' else '_light') + '.png', self.on_table),
-            ]
-
-            for i, (label, icon_path, callback) in enumerate(options):
-                button = QtWidgets.QPushButton(label)
-                button.setStyleSheet(f"""
-                    QPushButton {{
-                        background-color: {'#444' if colorMode == 'dark' else 'white'};
-                        border: 1px solid {'#666' if colorMode == 'dark' else '#ccc'};
-                        border-radius: 8px;
-                        padding: 10px;
-                        font-size: 14px;
-                        text-align: left;
-                        color: {'#ffffff' if colorMode == 'dark' else '#000000'};
-                    }}
-                    QPushButton:hover {{
-                        background-color: {'#555' if colorMode == 'dark' else '#f0f0f0'};
-                    }}
-                """)
-                icon_full_path = os.path.join(os.path.dirname(sys.argv[0]), icon_path)
-                if os.path.exists(icon_full_path):
-                    button.setIcon(QtGui.QIcon(icon_full_path))
-                button.clicked.connect(callback)
-                row = i // 2
-                col = i % 2
-                options_grid.addWidget(button, row, col)
-
-            content_layout.addLayout(options_grid)
-        else:
-            self.custom_input.setMinimumWidth(300)
+        # Options grid, only shown when there is selected text
+        self.options_widget = QtWidgets.QWidget()
+        options_grid = QtWidgets.QGridLayout(self.options_widget)
+        options_grid.setContentsMargins(0, 0, 0, 0)
+        options_grid.setSpacing(10)
+
+        options = [
+            ('Relecture', 'icons/magnifying-glass' + ('_dark' if colorMode() == 'dark' else '_light') + '.png', self.on_proofread),
+            ('Réécriture', 'icons/rotate-left' + ('_dark' if colorMode() == 'dark' else '_light') + '.png', self.on_rewrite),
+            ('Amical', 'icons/smiley-face' + ('_dark' if colorMode() == 'dark' else '_light') + '.png', self.on_friendly),
+            ('Professionnel', 'icons/briefcase' + ('_dark' if colorMode() == 'dark' else '_light') + '.png', self.on_professional),
+            ('Concis', 'icons/concise' + ('_dark' if colorMode() == 'dark' else '_light') + '.png', self.on_concise),
+            ('Résumé', 'icons/summary' + ('_dark' if colorMode() == 'dark' else '_light') + '.png', self.on_summary),
+            ('Points-Clés', 'icons/keypoints' + ('_dark' if colorMode() == 'dark' else '_light') + '.png', self.on_keypoints),
+            ('Tableau', 'icons/table' + ('_dark' if colorMode() == 'dark' else '_light') + '.png', self.on_table),
+        ]
+
+        for i, (label, icon_path, callback) in enumerate(options):
+            button = QtWidgets.QPushButton(label)
+            button.setStyleSheet(f"""
+                QPushButton {{
+                    background-color: {'#444' if colorMode() == 'dark' else 'white'};
+                    border: 1px solid {'#666' if colorMode() == 'dark' else '#ccc'};
+                    border-radius: 8px;
+                    padding: 10px;
+                    font-size: 14px;
+                    text-align: left;
+                    color: {'#ffffff' if colorMode() == 'dark' else '#000000'};
+                }}
+                QPushButton:hover {{
+                    background-color: {'#555' if colorMode() == 'dark' else '#f0f0f0'};
+                }}
+            """)
+            icon_full_path = os.path.join(os.path.dirname(sys.argv[0]), icon_path)
+            if os.path.exists(icon_full_path):
+                button.setIcon(QtGui.QIcon(icon_full_path))
+            button.clicked.connect(callback)
+            row = i // 2
+            col = i % 2
+            options_grid.addWidget(button, row, col)
+
+        content_layout.addWidget(self.options_widget)
+
+        self.reset(self.selected_text)
 
         logging.debug('CustomPopupWindow UI setup complete')
 
@@ -152,6 +149,18 @@ class CustomPopupWindow(QtWidgets.QWidget):
 
         QtCore.QTimer.singleShot(250, lambda: self.custom_input.setFocus())
 
+    def reset(self, selected_text):
+        """
+        Reset the popup for a new selection, so the same window can be shown again.
+        """
+        self.selected_text = selected_text
+        has_text = not not selected_text.strip()
+
+        self.custom_input.clear()
+        self.custom_input.setPlaceholderText("Describe your change..." if has_text else "Please enter an instruction...")
+        self.custom_input.setMinimumWidth(0 if has_text else 300)
+        self.options_widget.setVisible(has_text)
+
     def eventFilter(self, obj, event):
         """
         Event filter to handle focus out events.
@@ -38,7 +38,7 @@ class OnboardingWindow(QtWidgets.QWidget):
         UIUtils.clear_layout(self.content_layout)
 
         title_label = QtWidgets.QLabel("Welcome to Writing Tools!")
-        title_label.setStyleSheet(f"font-size: 24px; font-weight: bold; color: {'#ffffff' if colorMode == 'dark' else '#333333'};")
+        title_label.setStyleSheet(f"font-size: 24px; font-weight: bold; color: {'#ffffff' if colorMode() == 'dark' else '#333333'};")
         self.content_layout.addWidget(title_label, alignment=QtCore.Qt.AlignmentFlag.AlignCenter)
 
         features_text = """
@@ -51,33 +51,33 @@ class OnboardingWindow(QtWidgets.QWidget):
             - ANY OpenAI Compatible API — including local LLMs!
         """
         features_label = QtWidgets.QLabel(features_text)
-        features_label.setStyleSheet(f"font-size: 16px; color: {'#ffffff' if colorMode == 'dark' else '#333333'};")
+        features_label.setStyleSheet(f"font-size: 16px; color: {'#ffffff' if colorMode() == 'dark' else '#333333'};")
         features_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignLeft)
         self.content_layout.addWidget(features_label)
 
         shortcut_label = QtWidgets.QLabel("Customize your shortcut key (default: ctrl+space):")
-        shortcut_label.setStyleSheet(f"font-size: 16px; color: {'#ffffff' if colorMode == 'dark' else '#333333'};")
+        shortcut_label.setStyleSheet(f"font-size: 16px; color: {'#ffffff' if colorMode() == 'dark' else '#333333'};")
         self.content_layout.addWidget(shortcut_label)
 
         self.shortcut_input = QtWidgets.QLineEdit(self.shortcut)
         self.shortcut_input.setStyleSheet(f"""
             font-size: 16px;
             padding: 5px;
-            background-color: {'#444' if colorMode == 'dark' else 'white'};
-            color: {'#ffffff' if colorMode == 'dark' else '#000000'};
-            border: 1px solid {'#666' if colorMode == 'dark' else '#ccc'};
+            background-color: {'#444' if colorMode() == 'dark' else 'white'};
+            color: {'#ffffff' if colorMode() == 'dark' else '#000000'};
+            border: 1px solid {'#666' if colorMode() == 'dark' else '#ccc'};
         """)
         self.content_layout.addWidget(self.shortcut_input)
 
         theme_label = QtWidgets.QLabel("Choose your theme:")
-        theme_label.setStyleSheet(f"font-size: 16px; color: {'#ffffff' if colorMode == 'dark' else '#333333'};")
+        theme_label.setStyleSheet(f"font-size: 16px; color: {'#ffffff' if colorMode() == 'dark' else '#333333'};")
         self.content_layout.addWidget(theme_label)
 
         theme_layout = QHBoxLayout()
         gradient_radio = QRadioButton("Gradient")
         plain_radio = QRadioButton("Plain")
-        gradient_radio.setStyleSheet(f"color: {'#ffffff' if colorMode == 'dark' else '#333333'};")
-        plain_radio.setStyleSheet(f"color: {'#ffffff' if colorMode == 'dark' else '#333333'};")
+        gradient_radio.setStyleSheet(f"color: {'#ffffff' if colorMode() == 'dark' else '#333333'};")
+        plain_radio.setStyleSheet(f"color: {'#ffffff' if colorMode() == 'dark' else '#333333'};")
         gradient_radio.setChecked(self.theme == 'gradient')
         plain_radio.setChecked(self.theme == 'plain')
         theme_layout.addWidget(gradient_radio)
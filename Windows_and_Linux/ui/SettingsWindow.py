@@ -52,7 +52,7 @@ class SettingsWindow(QtWidgets.QWidget):
                 provider_header_layout.addWidget(logo_label)
 
         provider_name_label = QtWidgets.QLabel(provider.provider_name)
-        provider_name_label.setStyleSheet(f"font-size: 18px; font-weight: bold; color: {'#ffffff' if colorMode == 'dark' else '#333333'};")
+        provider_name_label.setStyleSheet(f"font-size: 18px; font-weight: bold; color: {'#ffffff' if colorMode() == 'dark' else '#333333'};")
         provider_name_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignVCenter)
         provider_header_layout.addWidget(provider_name_label)
 
@@ -61,7 +61,7 @@ class SettingsWindow(QtWidgets.QWidget):
         if provider.description:
             description_label = QtWidgets.QLabel(provider.description)
 
-            description_label.setStyleSheet(f"font-size: 16px; color: {'#ffffff' if colorMode == 'dark' else '#333333'}; text-align: center;")
+            description_label.setStyleSheet(f"font-size: 16px; color: {'#ffffff' if colorMode() == 'dark' else '#333333'}; text-align: center;")
             description_label.setWordWrap(True)
 
             self.current_provider_layout.addWidget(description_label)
@@ -71,7 +71,7 @@ class SettingsWindow(QtWidgets.QWidget):
             button.setStyleSheet(f"""
                 QPushButton {{
                     background-color:
-                    {'#4CAF50' if colorMode == 'dark' else '#008CBA'};
+                    {'#4CAF50' if colorMode() == 'dark' else '#008CBA'};
                     color: white;
                     padding: 10px;
                     font-size: 16px;
@@ -80,7 +80,7 @@ class SettingsWindow(QtWidgets.QWidget):
                 }}
                 QPushButton:hover {{
                     background-color:
-                    {'#45a049' if colorMode == 'dark' else '#007095'};
+                    {'#45a049' if colorMode() == 'dark' else '#007095'};
                 }}
             """)
             button.clicked.connect(provider.button_action)
@@ -117,32 +117,32 @@ class SettingsWindow(QtWidgets.QWidget):
 
         if not self.providers_only:
             title_label = QtWidgets.QLabel("Settings")
-            title_label.setStyleSheet(f"font-size: 24px; font-weight: bold; color: {'#ffffff' if colorMode == 'dark' else '#333333'};")
+            title_label.setStyleSheet(f"font-size: 24px; font-weight: bold; color: {'#ffffff' if colorMode() == 'dark' else '#333333'};")
             content_layout.addWidget(title_label, alignment=QtCore.Qt.AlignmentFlag.AlignCenter)
 
             shortcut_label = QtWidgets.QLabel("Shortcut key:")
-            shortcut_label.setStyleSheet(f"font-size: 16px; color: {'#ffffff' if colorMode == 'dark' else '#333333'};")
+            shortcut_label.setStyleSheet(f"font-size: 16px; color: {'#ffffff' if colorMode() == 'dark' else '#333333'};")
             content_layout.addWidget(shortcut_label)
 
             self.shortcut_input = QtWidgets.QLineEdit(self.app.config.get('shortcut', 'ctrl+space'))
             self.shortcut_input.setStyleSheet(f"""
                 font-size: 16px;
                 padding: 5px;
-                background-color: {'#444' if colorMode == 'dark' else 'white'};
-                color: {'#ffffff' if colorMode == 'dark' else '#000000'};
-                border: 1px solid {'#666' if colorMode == 'dark' else '#ccc'};
+                background-color: {'#444' if colorMode() == 'dark' else 'white'};
+                color: {'#ffffff' if colorMode() == 'dark' else '#000000'};
+                border: 1px solid {'#666' if colorMode() == 'dark' else '#ccc'};
             """)
             content_layout.addWidget(self.shortcut_input)
 
             theme_label = QtWidgets.QLabel("Theme:")
-            theme_label.setStyleSheet(f"font-size: 16px; color: {'#ffffff' if colorMode == 'dark' else '#333333'};")
+            theme_label.setStyleSheet(f"font-size: 16px; color: {'#ffffff' if colorMode() == 'dark' else '#333333'};")
             content_layout.addWidget(theme_label)
 
             theme_layout = QHBoxLayout()
             self.gradient_radio = QRadioButton("Blurry Gradient")
             self.plain_radio = QRadioButton("Plain")
-            self.gradient_radio.setStyleSheet(f"color: {'#ffffff' if colorMode == 'dark' else '#333333'};")
-            self.plain_radio.setStyleSheet(f"color: {'#ffffff' if colorMode == 'dark' else '#333333'};")
+            self.gradient_radio.setStyleSheet(f"color: {'#ffffff' if colorMode() == 'dark' else '#333333'};")
+            self.plain_radio.setStyleSheet(f"color: {'#ffffff' if colorMode() == 'dark' else '#333333'};")
             current_theme = self.app.config.get('theme', 'gradient')
             self.gradient_radio.setChecked(current_theme == 'gradient')
             self.plain_radio.setChecked(current_theme == 'plain')
@@ -152,36 +152,36 @@ class SettingsWindow(QtWidgets.QWidget):
 
         # Checkbox for enabling streaming
         self.streaming_checkbox = QtWidgets.QCheckBox("Enable Response Streaming (experimental, not recommended)")
-        self.streaming_checkbox.setStyleSheet(f"font-size: 16px; color: {'#ffffff' if colorMode == 'dark' else '#333333'};")
+        self.streaming_checkbox.setStyleSheet(f"font-size: 16px; color: {'#ffffff' if colorMode() == 'dark' else '#333333'};")
         self.streaming_checkbox.setChecked(self.app.config.get('streaming', False))
         content_layout.addWidget(self.streaming_checkbox)
 
         # Setup dropdown to select provider
         provider_label = QtWidgets.QLabel("Choose AI Provider:")
-        provider_label.setStyleSheet(f"font-size: 16px; color: {'#ffffff' if colorMode == 'dark' else '#333333'};")
+        provider_label.setStyleSheet(f"font-size: 16px; color: {'#ffffff' if colorMode() == 'dark' else '#333333'};")
 
         self.provider_dropdown = QtWidgets.QComboBox()
         self.provider_dropdown.setStyleSheet(f"""
             font-size: 16px;
             padding: 5px;
-            background-color: {'#444' if colorMode == 'dark' else 'white'};
-            color: {'#ffffff' if colorMode == 'dark' else '#000000'};
-            border: 1px solid {'#666' if colorMode == 'dark' else '#ccc'};
+            background-color: {'#444' if colorMode() == 'dark' else 'white'};
+            color: {'#ffffff' if colorMode() == 'dark' else '#000000'};
+            border: 1px solid {'#666' if colorMode() == 'dark' else '#ccc'};
         """)
 
         self.provider_dropdown.setInsertPolicy(QtWidgets.QComboBox.InsertPolicy.NoInsert)
 
-        current_provider = self.app.config.get('provider', self.app.providers[0].provider_name)
+        current_provider = self.app.config.get('provider', self.app.provider_names[0])
 
-        for provider in self.app.providers:
-            self.provider_dropdown.addItem(provider.provider_name)
+        for provider_name in self.app.provider_names:
+            self.provider_dropdown.addItem(provider_name)
 
         self.provider_dropdown.setCurrentIndex(self.provider_dropdown.findText(current_provider))
 
         content_layout.addWidget(provider_label)
         content_layout.addWidget(self.provider_dropdown)
 
-        provider_instance = self.app.providers[self.provider_dropdown.currentIndex()]
+        provider_instance = self.app.get_provider(self.provider_dropdown.currentText())
 
         # Initialise a layout for providers to go into.
         self.provider_container = QtWidgets.QVBoxLayout(self.background)
@@ -203,7 +203,7 @@ class SettingsWindow(QtWidgets.QWidget):
 
         # When provider is changed, run self.init_provider_ui(provider_instance, provider_container)
         self.provider_dropdown.currentIndexChanged.connect(lambda: (
-            self.init_provider_ui(self.app.providers[self.provider_dropdown.currentIndex()], self.provider_container)
+            self.init_provider_ui(self.app.get_provider(self.provider_dropdown.currentText()), self.provider_container)
         ))
 
         save_button = QtWidgets.QPushButton("Finish AI Setup" if self.providers_only else "Save")
@@ -231,7 +231,7 @@ class SettingsWindow(QtWidgets.QWidget):
             """
 
             restart_notice = QtWidgets.QLabel(restart_text)
-            restart_notice.setStyleSheet(f"font-size: 15px; color: {'#cccccc' if colorMode == 'dark' else '#555555'}; font-style: italic;")
+            restart_notice.setStyleSheet(f"font-size: 15px; color: {'#cccccc' if colorMode() == 'dark' else '#555555'}; font-style: italic;")
             restart_notice.setWordWrap(True)
             content_layout.addWidget(restart_notice)
 
@@ -254,16 +254,14 @@ class SettingsWindow(QtWidgets.QWidget):
         app.config['streaming'] = self.streaming_checkbox.isChecked()
         app.config['provider'] = self.provider_dropdown.currentText()
 
-        app.providers[self.provider_dropdown.currentIndex()].save_config()
+        app.get_provider(self.provider_dropdown.currentText()).save_config()
 
         # Initialize the current provider, defaulting to Gemini 1.5 Flash
         provider_name = app.config.get('provider', 'Gemini 1.5 Flash')
 
-        app.current_provider = next(
-            (provider for provider in app.providers if provider.provider_name == provider_name), None)
-        if not app.current_provider:
+        if provider_name not in app.provider_names:
             logging.warning(f'Provider {provider_name} not found. Using default provider.')
-            app.current_provider = self.providers[0]
+        app.current_provider = app.get_provider(provider_name)
 
         app.current_provider.load_config(app.config.get("providers", {}).get(provider_name, {}))
 
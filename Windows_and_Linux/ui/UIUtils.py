@@ -4,8 +4,34 @@ import sys
 from PySide6 import QtGui, QtCore, QtWidgets
 from PySide6.QtGui import QImage, QPixmap
 
-import darkdetect
-colorMode = 'dark' if darkdetect.isDark() else 'light'
+# Cached system color scheme, 'dark' or 'light'; resolved on first use
+_color_mode = None
+
+
+def colorMode():
+    """
+    Get the system color scheme, 'dark' or 'light'.
+    Uses Qt's style hints (Qt 6.5+), and only falls back to darkdetect when Qt can't tell.
+    """
+    global _color_mode
+    if _color_mode is None:
+        style_hints = QtGui.QGuiApplication.styleHints()
+        scheme = style_hints.colorScheme() if hasattr(style_hints, 'colorScheme') else None
+        if scheme is not None and scheme != QtCore.Qt.ColorScheme.Unknown:
+            _color_mode = 'dark' if scheme == QtCore.Qt.ColorScheme.Dark else 'light'
+            style_hints.colorSchemeChanged.connect(_on_color_scheme_changed)
+        else:
+            import darkdetect
+            _color_mode = 'dark' if darkdetect.isDark() else 'light'
+    return _color_mode
+
+
+def _on_color_scheme_changed(scheme):
+    """
+    Keep the cached color scheme in sync when the user changes it.
+    """
+    global _color_mode
+    _color_mode = 'dark' if scheme == QtCore.Qt.ColorScheme.Dark else 'light'
 
 class UIUtils:
     @classmethod
@@ -64,12 +90,12 @@ class ThemeBackground(QtWidgets.QWidget):
         painter = QtGui.QPainter(self)
         if self.theme == 'gradient':
             if self.is_popup:
-                background_image = QtGui.QPixmap(os.path.join(os.path.dirname(sys.argv[0]), 'background_popup_dark.png' if colorMode == 'dark' else 'background_popup.png'))
+                background_image = QtGui.QPixmap(os.path.join(os.path.dirname(sys.argv[0]), 'background_popup_dark.png' if colorMode() == 'dark' else 'background_popup.png'))
             else:
-                background_image = QtGui.QPixmap(os.path.join(os.path.dirname(sys.argv[0]), 'background_dark.png' if colorMode == 'dark' else 'background.png'))
+                background_image = QtGui.QPixmap(os.path.join(os.path.dirname(sys.argv[0]), 'background_dark.png' if colorMode() == 'dark' else 'background.png'))
             painter.drawPixmap(self.rect(), background_image)
         else:
-            if colorMode == 'dark':
+            if colorMode() == 'dark':
                 painter.fillRect(self.rect(), QtGui.QColor(35, 35, 35))  # Dark mode color
             else:
                 painter.fillRect(self.rect(), QtGui.QColor(222, 222, 222))  # Light mode color
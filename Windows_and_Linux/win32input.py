@@ -0,0 +1,175 @@
+import ctypes
+import logging
+from ctypes import wintypes
+
+from PySide6 import QtCore
+
+user32 = ctypes.WinDLL('user32', use_last_error=True)
+user32.RegisterHotKey.argtypes = (wintypes.HWND, ctypes.c_int, wintypes.UINT, wintypes.UINT)
+user32.RegisterHotKey.restype = wintypes.BOOL
+user32.UnregisterHotKey.argtypes = (wintypes.HWND, ctypes.c_int)
+user32.UnregisterHotKey.restype = wintypes.BOOL
+user32.VkKeyScanW.argtypes = (wintypes.WCHAR,)
+user32.VkKeyScanW.restype = ctypes.c_short
+
+
+class MOUSEINPUT(ctypes.Structure):
+    _fields_ = [('dx', wintypes.LONG), ('dy', wintypes.LONG), ('mouseData', wintypes.DWORD),
+                ('dwFlags', wintypes.DWORD), ('time', wintypes.DWORD), ('dwExtraInfo', ctypes.c_size_t)]
+
+
+class KEYBDINPUT(ctypes.Structure):
+    _fields_ = [('wVk', wintypes.WORD), ('wScan', wintypes.WORD), ('dwFlags', wintypes.DWORD),
+                ('time', wintypes.DWORD), ('dwExtraInfo', ctypes.c_size_t)]
+
+
+class _INPUTUNION(ctypes.Union):
+    # MOUSEINPUT is the largest member, so it is needed for INPUT to have the right size
+    _fields_ = [('mi', MOUSEINPUT), ('ki', KEYBDINPUT)]
+
+
+class INPUT(ctypes.Structure):
+    _fields_ = [('type', wintypes.DWORD), ('union', _INPUTUNION)]
+
+
+user32.SendInput.argtypes = (wintypes.UINT, ctypes.POINTER(INPUT), ctypes.c_int)
+user32.SendInput.restype = wintypes.UINT
+
+INPUT_KEYBOARD = 1
+KEYEVENTF_KEYUP = 0x0002
+VK_CONTROL = 0x11
+
+WM_HOTKEY = 0x0312
+
+MOD_ALT = 0x0001
+MOD_CONTROL = 0x0002
+MOD_SHIFT = 0x0004
+MOD_WIN = 0x0008
+MOD_NOREPEAT = 0x4000
+
+# Modifier names as used in the shortcut setting (pynput naming)
+MODIFIERS = {
+    'ctrl': MOD_CONTROL, 'ctrl_l': MOD_CONTROL, 'ctrl_r': MOD_CONTROL,
+    'alt': MOD_ALT, 'alt_l': MOD_ALT, 'alt_r': MOD_ALT, 'alt_gr': MOD_ALT | MOD_CONTROL,
+    'shift': MOD_SHIFT, 'shift_l': MOD_SHIFT, 'shift_r': MOD_SHIFT,
+    'cmd': MOD_WIN, 'cmd_l': MOD_WIN, 'cmd_r': MOD_WIN, 'win': MOD_WIN,
+}
+
+# Named keys as used in the shortcut setting (pynput naming) -> virtual-key codes
+VIRTUAL_KEYS = {
+    'space': 0x20, 'enter': 0x0D, 'tab': 0x09, 'esc': 0x1B, 'backspace': 0x08,
+    'delete': 0x2E, 'insert': 0x2D, 'home': 0x24, 'end': 0x23,
+    'page_up': 0x21, 'page_down': 0x22,
+    'left': 0x25, 'up': 0x26, 'right': 0x27, 'down': 0x28,
+    'pause': 0x13, 'print_screen': 0x2C, 'caps_lock': 0x14,
+    'num_lock': 0x90, 'scroll_lock': 0x91, 'menu': 0x5D,
+    **{f'f{i}': 0x70 + i - 1 for i in range(1, 25)},
+}
+
+
+def _ctrl_chord(vk):
+    """
+    Build the Ctrl down, key down, key up, Ctrl up input sequence for the given key.
+    """
+    inputs = (INPUT * 4)()
+    for i, (key, flags) in enumerate(((VK_CONTROL, 0), (vk, 0), (vk, KEYEVENTF_KEYUP), (VK_CONTROL, KEYEVENTF_KEYUP))):
+        inputs[i].type = INPUT_KEYBOARD
+        inputs[i].union.ki = KEYBDINPUT(wVk=key, dwFlags=flags)
+    return inputs
+
+
+# Prebuilt so each keystroke is a single SendInput call with no allocation
+_COPY_INPUTS = _ctrl_chord(0x43)  # C
+_PASTE_INPUTS = _ctrl_chord(0x56)  # V
+
+
+def _send_inputs(inputs):
+    sent = user32.SendInput(len(inputs), inputs, ctypes.sizeof(INPUT))
+    if sent != len(inputs):
+        raise ctypes.WinError(ctypes.get_last_error())
+
+
+def send_ctrl_c():
+    """
+    Simulate Ctrl+C as one atomic batch of keyboard input.
+    """
+    _send_inputs(_COPY_INPUTS)
+
+
+def send_ctrl_v():
+    """
+    Simulate Ctrl+V as one atomic batch of keyboard input.
+    """
+    _send_inputs(_PASTE_INPUTS)
+
+
+def parse_shortcut(shortcut):
+    """
+    Parse a shortcut string such as 'ctrl+alt+h' into (modifiers, virtual-key code).
+    Raises ValueError if the shortcut cannot be registered with RegisterHotKey.
+    """
+    modifiers = 0
+    vk = None
+    for token in shortcut.lower().split('+'):
+        token = token.strip().strip('<>')
+        if token in MODIFIERS:
+            modifiers |= MODIFIERS[token]
+        elif vk is not None:
+            raise ValueError(f'More than one non-modifier key in shortcut: {shortcut}')
+        elif token in VIRTUAL_KEYS:
+            vk = VIRTUAL_KEYS[token]
+        elif len(token) == 1:
+            scan = user32.VkKeyScanW(token)
+            if scan == -1:
+                raise ValueError(f'Key not available on this keyboard layout: {token}')
+            vk = scan & 0xFF
+        else:
+            raise ValueError(f'Unknown key in shortcut: {token}')
+
+    if vk is None:
+        raise ValueError(f'No key in shortcut: {shortcut}')
+    return modifiers, vk
+
+
+class Win32Hotkey(QtCore.QAbstractNativeEventFilter):
+    """
+    A system-wide hotkey registered with RegisterHotKey and delivered through the Qt event loop.
+    """
+    HOTKEY_ID = 1
+
+    def __init__(self, callback):
+        super().__init__()
+        self.callback = callback
+        self.registered = False
+
+    def register(self, shortcut):
+        """
+        Register the given shortcut, replacing any previously registered one.
+        """
+        self.unregister()
+        modifiers, vk = parse_shortcut(shortcut)
+        # hwnd=None posts WM_HOTKEY to this (the GUI) thread's message queue
+        if not user32.RegisterHotKey(None, self.HOTKEY_ID, modifiers | MOD_NOREPEAT, vk):
+            raise ctypes.WinError(ctypes.get_last_error())
+        self.registered = True
+
+    def unregister(self):
+        """
+        Unregister the current shortcut, if any.
+        """
+        if self.registered:
+            user32.UnregisterHotKey(None, self.HOTKEY_ID)
+            self.registered = False
+
+    def nativeEventFilter(self, eventType, message):
+        """
+        Dispatch WM_HOTKEY messages for our hotkey to the callback.
+        """
+        if eventType == b'windows_generic_MSG':
+            msg = wintypes.MSG.from_address(int(message))
+            if msg.message == WM_HOTKEY and msg.wParam == self.HOTKEY_ID:
+                logging.debug('triggered hotkey')
+                # Run the callback from the event loop, not from inside the native event filter
+                QtCore.QTimer.singleShot(0, self.callback)
+                return True, 0
+        return False, 0